@@ -0,0 +1,118 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+from functools import partial
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+from tickets import COLUMN_NAMES, INT_COLUMNS, cached_row, fetch_pages, load_resolved_rows, process_issue
+from urllib3.util import Retry
+import argparse
+import os
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import requests
+
+load_dotenv()
+
+# ==========================
+# CONFIG
+# ==========================
+# An unset Actions secret arrives as an empty string, not a missing variable
+JIRA_URL = (os.getenv("JIRA_BASE_URL") or "https://sierrawireless.atlassian.net").rstrip("/")
+USERNAME = os.getenv("JIRA_USER_EMAIL")
+PASSWORD = os.getenv("JIRA_API_TOKEN")
+
+# JQL per report mode
+MODES = {
+    # Everything since the dashboard started tracking (GitHub Actions job)
+    "live": 'project = GNOC AND issuetype = Incident AND created >= "2026-01-17" ',
+    # Weekly SLA report
+    "weekly": 'project = GNOC AND issuetype = Incident AND created >= "2026-03-07" AND created < "2026-03-14" AND priority != P5-Lowest'
+}
+
+OUTPUT_FILE = "data/GNOC_Incident_Time.csv"
+
+OUTPUT_SCHEMA = pa.schema([
+    (name, pa.int64() if name in INT_COLUMNS else pa.string())
+    for name in COLUMN_NAMES
+])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Export GNOC incident time in status and SLA to CSV")
+    arg_parser.add_argument("--mode", choices=MODES, default="live")
+    arg_parser.add_argument("--output", default=OUTPUT_FILE)
+    args = arg_parser.parse_args()
+
+    # ==========================
+    # CONNECT TO JIRA
+    # ==========================
+    session = requests.Session()
+    session.auth = (USERNAME, PASSWORD)
+    session.headers["Accept"] = "application/json"
+
+    # Jira Cloud rate-limits with 429 and has transient 5xx; retry with backoff
+    # (honouring Retry-After) like the jira client's ResilientSession did
+    retries = Retry(
+        total=3,
+        backoff_factor=2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retries))
+    session.mount("http://", HTTPAdapter(max_retries=retries))
+
+    print("Fetching Jira issues...")
+
+    pages = fetch_pages(session, JIRA_URL, MODES[args.mode])
+
+    # ==========================
+    # PROCESS ISSUES
+    # ==========================
+    filename = args.output
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    now = datetime.now(timezone.utc)
+
+    # Resolved tickets that have not been updated since the last export are
+    # copied from it instead of being processed again
+    cached = load_resolved_rows(filename)
+
+    # Issues are plain JSON dicts, so they pickle cheaply to the worker
+    # processes; chunks amortize the per-task overhead.
+    with ProcessPoolExecutor() as executor:
+        # Each page's stale issues are handed to the pool as soon as the page
+        # arrives, so processing overlaps the download of the next page
+        batches = []
+        for page in pages:
+            reused = [cached_row(cached, issue) for issue in page]
+            stale = [issue for issue, row in zip(page, reused) if row is None]
+            fresh = executor.map(partial(process_issue, now=now), stale, chunksize=64)
+            batches.append((reused, fresh))
+
+        total = sum(len(reused) for reused, _ in batches)
+        reused_count = sum(row is not None for reused, _ in batches for row in reused)
+        print(f"Reusing {reused_count} unchanged resolved tickets")
+
+        cols = {name: [] for name in COLUMN_NAMES}
+        with tqdm(total=total, unit="ticket") as progress:
+            for reused, fresh in batches:
+                for row in reused:
+                    if row is None:
+                        row = next(fresh)
+                    for name, values in cols.items():
+                        values.append(row[name])
+                    progress.update()
+
+    # ==========================
+    # EXPORT CSV
+    # ==========================
+    # Written to a temporary file that replaces the CSV once complete
+    table = pa.Table.from_pydict(cols, schema=OUTPUT_SCHEMA)
+    pa_csv.write_csv(table, filename + ".tmp", pa_csv.WriteOptions(quoting_style="needed"))
+    os.replace(filename + ".tmp", filename)
+
+    print(f"Exported {total} tickets to {filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+from concurrent.futures import ThreadPoolExecutor
+from dateutil import parser
+from datetime import datetime, timedelta
+from functools import lru_cache
+import csv
+import operator
+import orjson
+import sys
+
+# ==========================
+# STATUSES
+# ==========================
+FINAL_STATUSES = {
+    "COMPLETED",
+    "CLOSED",
+    "CANCELLED",
+    "CANCELED"
+}
+
+# Valid statuses -> slot in the per-ticket totals list
+STATUS_CODES = {
+    "OPEN": 0,
+    "WORK IN PROGRESS": 1,
+    "IN REVIEW": 2,
+    "COMPLETED": 3,
+    "CANCELLED": 4,
+    "CANCELED": 4,
+    "CLOSED": 5
+}
+
+# IS_FINAL[code] is True for statuses that stop the clock
+IS_FINAL = tuple(
+    code in {STATUS_CODES[s] for s in FINAL_STATUSES}
+    for code in range(6)
+)
+
+# Sort keys for the rare out-of-order changelog
+_key = operator.itemgetter(1)
+_change_key = operator.itemgetter("time")
+
+ONE_MICROSECOND = timedelta(microseconds=1)
+MICROSECONDS_PER_MINUTE = 60 * 1_000_000
+
+# ==========================
+# OUTPUT COLUMNS
+# ==========================
+COLUMN_NAMES = [
+    "Issue key",
+    "Summary",
+    "Issue Type",
+    "Status",
+    "Project name",
+    "Project type",
+    "Priority",
+    "Resolution",
+    "Assignee",
+    "Reporter",
+    "Creator",
+    "Created",
+    "Updated",
+    "Resolved",
+    "Components",
+    "Source / Detection",
+    "Investigation Type",
+
+    "OPEN (Minutes)",
+    "WORK IN PROGRESS (Minutes)",
+    "IN REVIEW (Minutes)",
+    "COMPLETED (Minutes)",
+    "CANCELLED (Minutes)",
+    "CLOSED (Minutes)",
+
+    "Time to Resolution (Minutes)",
+    "SLA Status",
+    "Time Breached (Minutes)"
+]
+
+INT_COLUMNS = [name for name in COLUMN_NAMES if name.endswith("(Minutes)")]
+
+# ==========================
+# RAW FIELD ACCESS
+# ==========================
+def _get(fields, name, key):
+    value = fields.get(name)
+    return value.get(key) if isinstance(value, dict) else value
+
+def _option_text(value):
+    # Custom fields can be an option dict, a list of them (multi-select) or a
+    # bare number/string; the export wants text, lists joined like Components
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return ", ".join(filter(None, map(_option_text, value))) or None
+    if isinstance(value, dict):
+        value = value.get("value")
+        return None if value is None else str(value)
+    return str(value)
+
+# ==========================
+# SLA CONFIG (MINUTES)
+# ==========================
+SLA_MINUTES = {
+    "HIGHEST": 2 * 60,
+    "HIGH": 4 * 60,
+    "MEDIUM": 24 * 60,
+    "LOW": 48 * 60,
+    "LOWEST": 60 * 60
+}
+
+def _scan_sla_minutes(priority_name):
+    for key, minutes in SLA_MINUTES.items():
+        if key in priority_name:
+            return minutes
+    return None
+
+# Upper-cased priority name -> SLA minutes, filled from the substring scan so
+# a cached name always gets the same answer the scan would give
+_SLA_BY_NAME = {name: _scan_sla_minutes(name) for name in SLA_MINUTES}
+
+@lru_cache(maxsize=32)
+def get_sla_minutes(priority_name):
+    if not priority_name:
+        return None
+    priority_name = priority_name.upper()
+    if priority_name not in _SLA_BY_NAME:
+        _SLA_BY_NAME[priority_name] = _scan_sla_minutes(priority_name)
+    return _SLA_BY_NAME[priority_name]
+
+def get_sla_result(priority_name, time_to_resolution_min):
+    sla_minutes = get_sla_minutes(priority_name)
+
+    if sla_minutes is None:
+        return None, 0
+    if time_to_resolution_min > sla_minutes:
+        return "Breached", time_to_resolution_min - sla_minutes
+    return "Met", 0
+
+# ==========================
+# TIMESTAMP PARSING
+# ==========================
+# Jira returns ISO-8601 timestamps such as 2026-01-17T10:23:45.123+0000.
+# fromisoformat accepts the +0000 offset from Python 3.11 on; older
+# versions need it normalized first. strptime with the exact Jira format
+# is far slower than fromisoformat but still beats dateutil, so it sits
+# between the two (it also takes fractions fromisoformat < 3.11 rejects).
+JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+def _parse_slow(ts):
+    try:
+        return datetime.strptime(ts, JIRA_TIME_FORMAT)
+    except ValueError:
+        return parser.isoparse(ts)
+
+if sys.version_info >= (3, 11):
+    def _parse(ts):
+        try:
+            return datetime.fromisoformat(ts)
+        except ValueError:
+            return _parse_slow(ts)
+else:
+    def _parse(ts):
+        try:
+            return datetime.fromisoformat(
+                ts[:-1] + "+00:00" if ts.endswith("Z") else ts.replace("+0000", "+00:00")
+            )
+        except ValueError:
+            return _parse_slow(ts)
+
+# created/resolutiondate values repeat across issues raised by automation
+_parse_cached = lru_cache(maxsize=100_000)(_parse)
+
+# ==========================
+# FETCH PAGES
+# ==========================
+# Only the fields read by process_issue; keeping the payload small lets Jira
+# return more issues per page (it clamps maxResults server-side).
+SEARCH_FIELDS = (
+    "summary,status,priority,resolution,issuetype,project,assignee,reporter,"
+    "creator,created,updated,resolutiondate,components,customfield_10040,customfield_10563"
+)
+
+# (connect, read) seconds; large changelog pages can take a while to send
+REQUEST_TIMEOUT = (10, 120)
+
+def fetch_pages(session, base_url, jql, page_size=5000):
+    url = f"{base_url}/rest/api/3/search/jql"
+
+    def get_page(token):
+        params = {
+            "jql": jql,
+            "fields": SEARCH_FIELDS,
+            "expand": "changelog",
+            "maxResults": page_size
+        }
+        if token:
+            params["nextPageToken"] = token
+        response = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        # Changelog pages run to megabytes; orjson parses them much faster
+        return orjson.loads(response.content)
+
+    # Each page carries the token for the next one, so pages are fetched one
+    # at a time; the next page downloads while the caller processes this one.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(get_page, None)
+        while future is not None:
+            page = future.result()
+            token = page.get("nextPageToken")
+            future = executor.submit(get_page, token) if token else None
+            yield page.get("issues", [])
+
+# ==========================
+# PROCESS ISSUE
+# ==========================
+def process_issue(issue, now):
+    fields = issue["fields"]
+    status = fields["status"]
+    priority = fields.get("priority")
+    project = fields.get("project")
+    resolved = fields.get("resolutiondate")
+    components = fields.get("components")
+
+    created_time = _parse_cached(fields["created"])
+    resolution_time = _parse_cached(resolved) if resolved else now
+
+    # Build status timeline
+    status_changes = []
+
+    for history in issue["changelog"]["histories"]:
+        for item in history["items"]:
+            if item["field"] == "status":
+                from_status = item["fromString"]
+                status_changes.append({
+                    "from": from_status.upper() if from_status else None,
+                    "to": item["toString"].upper(),
+                    "time": _parse_cached(history["created"])
+                })
+
+    # Histories normally come back in chronological order; only sort when
+    # they don't, so the initial status below is taken from the earliest one
+    if any(a["time"] > b["time"] for a, b in zip(status_changes, status_changes[1:])):
+        status_changes.sort(key=_change_key)
+
+    timeline = []
+
+    # Correct initial status
+    if status_changes and status_changes[0]["from"]:
+        initial_status = status_changes[0]["from"]
+    else:
+        initial_status = status["name"].upper()
+
+    code = STATUS_CODES.get(initial_status)
+    if code is not None:
+        timeline.append((code, created_time))
+
+    # Apply transitions
+    for change in status_changes:
+        code = STATUS_CODES.get(change["to"])
+        if code is not None:
+            timeline.append((code, change["time"]))
+
+    # A history stamped before "created" still puts the timeline out of order
+    if any(a[1] > b[1] for a, b in zip(timeline, timeline[1:])):
+        timeline.sort(key=_key)
+
+    # Time per status (whole microseconds, so no float rounding)
+    totals = [0, 0, 0, 0, 0, 0]
+    ends = [t for _, t in timeline[1:]]
+    ends.append(resolution_time)
+
+    for (code, start), end in zip(timeline, ends):
+        # Stop clock after final states
+        if IS_FINAL[code]:
+            continue
+
+        if end > start:
+            totals[code] += (end - start) // ONE_MICROSECOND
+
+    (
+        open_min,
+        wip_min,
+        review_min,
+        completed_min,
+        cancelled_min,
+        closed_min
+    ) = (us // MICROSECONDS_PER_MINUTE for us in totals)
+
+    # Time to resolution (SLA)
+    time_to_resolution_min = open_min + wip_min + review_min
+
+    sla_status, time_breached_min = get_sla_result(
+        priority["name"] if priority else None,
+        time_to_resolution_min
+    )
+
+    return {
+        "Issue key": issue["key"],
+        "Summary": fields["summary"],
+        "Issue Type": _get(fields, "issuetype", "name"),
+        "Status": status["name"] if status else None,
+        "Project name": project["name"] if project else None,
+        "Project type": project["projectTypeKey"] if project else None,
+        "Priority": priority["name"] if priority else None,
+        "Resolution": _get(fields, "resolution", "name"),
+        "Assignee": _get(fields, "assignee", "displayName") or "Unassigned",
+        "Reporter": _get(fields, "reporter", "displayName"),
+        "Creator": _get(fields, "creator", "displayName"),
+        "Created": fields["created"],
+        "Updated": fields["updated"],
+        "Resolved": resolved,
+        "Components": ", ".join(c["name"] for c in components) if components else None,
+        "Source / Detection": _option_text(fields.get("customfield_10040")),
+        "Investigation Type": _option_text(fields.get("customfield_10563")),
+
+        "OPEN (Minutes)": open_min,
+        "WORK IN PROGRESS (Minutes)": wip_min,
+        "IN REVIEW (Minutes)": review_min,
+        "COMPLETED (Minutes)": completed_min,
+        "CANCELLED (Minutes)": cancelled_min,
+        "CLOSED (Minutes)": closed_min,
+
+        "Time to Resolution (Minutes)": time_to_resolution_min,
+        "SLA Status": sla_status,
+        "Time Breached (Minutes)": time_breached_min
+    }
+
+# ==========================
+# PREVIOUS EXPORT CACHE
+# ==========================
+def load_resolved_rows(filename):
+    # Resolved tickets from the last export, keyed by issue key. Their minutes
+    # are fixed by the resolution date, so a row holds until the issue changes;
+    # the SLA columns are recomputed on reuse (see cached_row).
+    try:
+        f = open(filename, newline="", encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+
+    rows = {}
+    with f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != COLUMN_NAMES:
+            return rows
+        for row in reader:
+            if not row["Resolved"]:
+                continue
+            row = {name: value if value != "" else None for name, value in row.items()}
+            for name in INT_COLUMNS:
+                row[name] = int(row[name])
+            rows[row["Issue key"]] = row
+    return rows
+
+def cached_row(cached, issue):
+    row = cached.get(issue["key"])
+    if row is None or row["Updated"] != issue["fields"]["updated"]:
+        return None
+
+    # Only the time-in-status minutes are trusted from the previous export;
+    # SLA status and breach follow the current SLA rules on every run
+    row = dict(row)
+    row["SLA Status"], row["Time Breached (Minutes)"] = get_sla_result(
+        row["Priority"],
+        row["Time to Resolution (Minutes)"]
+    )
+    return row